@@ -402,8 +402,9 @@ def build_namespace_tree(
             # add all namespaces up to root to index so we trigger
             # empty namespace generation in the final tree building
             # loop below.
-            for i in range(len(dsdl_type.name_components) - 1, 0, -1):
-                ancestor_ns = ".".join(dsdl_type.name_components[0:i])
+            name_components = dsdl_type.name_components
+            for i in range(len(name_components) - 1, 0, -1):
+                ancestor_ns = ".".join(name_components[0:i])
                 if ancestor_ns in namespace_index:
                     break
                 namespace_index.add(ancestor_ns)
@@ -56,6 +56,8 @@ class DSDLTemplateLoader(BaseLoader):
         super().__init__(**kwargs)
         self._type_to_template_lookup_cache = dict()  # type: typing.Dict[pydsdl.Any, pathlib.Path]
         self._templates_package_name = None  # type: typing.Optional[str]
+        self._fsloader_templates = None  # type: typing.Optional[typing.Mapping[str, pathlib.Path]]
+        self._package_loader_templates = None  # type: typing.Optional[typing.Mapping[str, pathlib.Path]]
 
         if templates_dirs is not None:
             for templates_dir_item in templates_dirs:
@@ -187,17 +189,17 @@ class DSDLTemplateLoader(BaseLoader):
             assert template_name.name == 'Any.j2'
 
         """
-        template_path = None
+        template_path = self._type_to_template_lookup_cache.get(value_type)
+        if template_path is not None:
+            return template_path
         if self._fsloader is not None:
-            filtered_templates = self._filter_template_list_by_suffix(self._fsloader.list_templates())
-            template_path = self._type_to_template_internal(
-                value_type, dict(map(lambda x: (pathlib.Path(x).stem, pathlib.Path(x)), filtered_templates))
-            )
+            if self._fsloader_templates is None:
+                self._fsloader_templates = self._templates_by_stem(self._fsloader.list_templates())
+            template_path = self._type_to_template_internal(value_type, self._fsloader_templates)
         if template_path is None and self._package_loader is not None:
-            filtered_templates = self._filter_template_list_by_suffix(self._package_loader.list_templates())
-            template_path = self._type_to_template_internal(
-                value_type, dict(map(lambda x: (pathlib.Path(x).stem, pathlib.Path(x)), filtered_templates))
-            )
+            if self._package_loader_templates is None:
+                self._package_loader_templates = self._templates_by_stem(self._package_loader.list_templates())
+            template_path = self._type_to_template_internal(value_type, self._package_loader_templates)
 
         return template_path
 
@@ -208,6 +210,11 @@ class DSDLTemplateLoader(BaseLoader):
     def _filter_template_list_by_suffix(files: typing.List[str]) -> typing.List[str]:
         return [f for f in files if (pathlib.Path(f).suffix == TEMPLATE_SUFFIX)]
 
+    @classmethod
+    def _templates_by_stem(cls, files: typing.List[str]) -> typing.Mapping[str, pathlib.Path]:
+        filtered_templates = cls._filter_template_list_by_suffix(files)
+        return dict(map(lambda x: (pathlib.Path(x).stem, pathlib.Path(x)), filtered_templates))
+
     def _type_to_template_internal(
         self, value_type: typing.Type, templates: typing.Mapping[str, pathlib.Path]
     ) -> typing.Optional[pathlib.Path]:
@@ -239,4 +246,9 @@ class DSDLTemplateLoader(BaseLoader):
                         search_queue.appendleft(base_type)
                         discovered.add(current_search_type)
 
+        if template_path is not None:
+            # Also record the requested type itself so later lookups for it skip the search
+            # through its bases.
+            self._type_to_template_lookup_cache[value_type] = template_path
+
         return template_path
@@ -144,18 +144,9 @@ class UniqueNameGenerator:
         Uses a global index to generate a number unique to a given base_token within a template
         for a given domain (key).
         """
-        try:
-            keymap = self._index_map[key]
-        except KeyError:
-            keymap = {}
-            self._index_map[key] = keymap
-
-        try:
-            next_index = keymap[base_token]
-            keymap[base_token] = next_index + 1
-        except KeyError:
-            next_index = 0
-            keymap[base_token] = 1
+        keymap = self._index_map.setdefault(key, {})
+        next_index = keymap.get(base_token, 0)
+        keymap[base_token] = next_index + 1
 
         return "{prefix}{base_token}{index}{suffix}".format(
             prefix=prefix, base_token=base_token, index=next_index, suffix=suffix
@@ -317,9 +308,10 @@ class TokenEncoder:
         self._token_encoding_rules_by_identifier_type = self._get_map_of_type_to_lists_of_patterns(
             language, "token_encoding_rules_by_identifier_type"
         )
-        self._reserved_identifiers = language.get_config_value_as_list("reserved_identifiers", default_value=[])
+        reserved_identifiers = language.get_config_value_as_list("reserved_identifiers", default_value=[])
         if additional_reserved_identifiers is not None:
-            self._reserved_identifiers = self._reserved_identifiers + additional_reserved_identifiers
+            reserved_identifiers = reserved_identifiers + additional_reserved_identifiers
+        self._reserved_identifiers = frozenset(reserved_identifiers)  # type: typing.FrozenSet[str]
         self._stropping_prefix = language.get_config_value("stropping_prefix", "")
         self._stropping_suffix = language.get_config_value("stropping_suffix", "")
         self._encoding_prefix = language.get_config_value("encoding_prefix", "")
@@ -344,39 +336,32 @@ class TokenEncoder:
         else:
             return "".join(map(self.encode_character, matched_span))
 
-    def _matches(
-        self, input_string: str, patterns: typing.Union[typing.List[typing.Pattern], typing.List[str]]
-    ) -> bool:
-        for string_or_pattern in patterns:
-            if isinstance(string_or_pattern, str):
-                if string_or_pattern == input_string:
-                    return True
-            elif string_or_pattern.match(input_string):
+    @staticmethod
+    def _matches(input_string: str, patterns: typing.List[typing.Pattern]) -> bool:
+        for pattern in patterns:
+            if pattern.match(input_string):
                 return True
         return False
 
     def _encode(self, token: str, token_type: str, dry_run: bool) -> str:
         encoded = token
-        try:
-            encoding_rules = self._token_encoding_rules_by_identifier_type[token_type]
-
-            for token_pattern in encoding_rules:
-                if not dry_run:
-                    encoded = token_pattern.sub(self._encoding_filter, encoded)
-                elif token_pattern.match(encoded):
-                    raise RuntimeError(
-                        'Unstable encoding: using prefix "{}" partially encoded token: "{}"'.format(
-                            self._encoding_prefix, encoded
-                        )
+        encoding_rules = self._token_encoding_rules_by_identifier_type.get(token_type, [])
+
+        for token_pattern in encoding_rules:
+            if not dry_run:
+                encoded = token_pattern.sub(self._encoding_filter, encoded)
+            elif token_pattern.match(encoded):
+                raise RuntimeError(
+                    'Unstable encoding: using prefix "{}" partially encoded token: "{}"'.format(
+                        self._encoding_prefix, encoded
                     )
-        except KeyError:
-            pass
+                )
         return encoded
 
     def _strop_by_keyword(self, token: str, token_type: str, dry_run: bool) -> str:
         stropped = token
 
-        if self._matches(stropped, self._reserved_identifiers):
+        if stropped in self._reserved_identifiers:
             if not dry_run:
                 stropped = self._stropping_prefix + stropped + self._stropping_suffix
             else:
@@ -391,7 +376,7 @@ class TokenEncoder:
 
         stropped = token
 
-        reserved_pattern_rules = self._reserved_token_patterns_by_type[token_type]
+        reserved_pattern_rules = self._reserved_token_patterns_by_type.get(token_type, [])
 
         if self._matches(stropped, reserved_pattern_rules):
             if not dry_run:
@@ -407,18 +392,10 @@ class TokenEncoder:
     def _do_for_type_and_all(
         self, transform: typing.Callable[[str, str, bool], str], token: str, token_type: str, dry_run: bool
     ) -> str:
-        transformed = token
-
-        try:
-            transformed = transform(transformed, "all", dry_run)
-        except KeyError:
-            pass
+        transformed = transform(token, "all", dry_run)
 
         if token_type != "all":
-            try:
-                transformed = transform(transformed, token_type, dry_run)
-            except KeyError:
-                pass
+            transformed = transform(transformed, token_type, dry_run)
 
         return transformed
 
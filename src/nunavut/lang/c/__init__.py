@@ -422,6 +422,14 @@ _snake_case_pattern_2 = re.compile(r"(?<=_)([A-Z])+")  # 'port_SubjectID_list' -
 _snake_case_pattern_3 = re.compile(r"(?<=[a-z])([A-Z])+")  # 'port_subjectID_list' -> 'port_subject_id_list'
 
 
+def _snake_case_lower(match: typing.Match[str]) -> str:
+    return match.group(0).lower()
+
+
+def _snake_case_separate_lower(match: typing.Match[str]) -> str:
+    return "_" + match.group(0).lower()
+
+
 def filter_to_snake_case(value: str) -> str:
     """
     Filter to transform a string into a snake-case token.
@@ -479,9 +487,9 @@ def filter_to_snake_case(value: str) -> str:
     :return: A valid C99 token using the snake-case convention.
     """
     pass0 = _snake_case_pattern_0.sub("_", str.strip(value))
-    pass1 = _snake_case_pattern_1.sub(lambda x: "_" + x.group(0).lower(), pass0)
-    pass2 = _snake_case_pattern_2.sub(lambda x: x.group(0).lower(), pass1)
-    return _snake_case_pattern_3.sub(lambda x: "_" + x.group(0).lower(), pass2).lower()
+    pass1 = _snake_case_pattern_1.sub(_snake_case_separate_lower, pass0)
+    pass2 = _snake_case_pattern_2.sub(_snake_case_lower, pass1)
+    return _snake_case_pattern_3.sub(_snake_case_separate_lower, pass2).lower()
 
 
 def filter_to_screaming_snake_case(value: str) -> str:
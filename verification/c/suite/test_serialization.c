@@ -6,6 +6,8 @@
 #include <regulated/basics/Primitive_0_1.h>
 #include <regulated/basics/PrimitiveArrayFixed_0_1.h>
 #include <regulated/basics/PrimitiveArrayVariable_0_1.h>
+#include <regulated/basics/ByteAligned_0_1.h>
+#include <regulated/basics/LongByteArray_0_1.h>
 #include <regulated/delimited/A_1_0.h>
 #include <regulated/delimited/A_1_1.h>
 #include <uavcan/pnp/NodeIDAllocationData_2_0.h>
@@ -848,6 +850,356 @@ static void testPrimitiveArrayVariable(void)
     }
 }
 
+/// The representation of the object made by initByteAlignedReference(), assembled by hand field by field
+/// following the layout of ByteAligned.0.1. The bracketed numbers are byte offsets.
+static const uint8_t ByteAlignedReference[] = {
+    0x56, 0x34, 0x12,                                       // [0]  uint24 u24
+    0xBC, 0x0A,                                             // [3]  uint12 u12, void4
+    0x05, 0x04, 0x03, 0x02, 0x01,                           // [5]  uint40 u40
+    0x05,                                                   // [10] uint3 u3, void5
+    0x32, 0x54, 0x76, 0x98, 0xBA, 0xDC, 0xFE, 0x01,         // [11] uint57 u57, void7
+    0xFE, 0xFF,                                             // [19] int16 i16
+    0xEF, 0xCD, 0xAB, 0x89,                                 // [21] uint32 u32
+    0x00, 0x3E,                                             // [25] float16 f16
+    0x00, 0x00, 0x20, 0xC0,                                 // [27] float32 f32
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xD0, 0x3F,         // [31] float64 f64
+    0x01, 0x02, 0x03, 0x04, 0x05,                           // [39] uint8[5] bytes_5
+    0x22, 0x11, 0x44, 0x33, 0x66, 0x55,                     // [44] uint16[3] u16_3
+    0x00, 0x00, 0x80, 0x3F, 0x00, 0x00, 0x00, 0xC0,         // [50] float32[2] f32_2
+    0x03, 0xAA, 0xBB, 0xCC,                                 // [58] uint8[<=6] bytes_le6
+    0x02, 0xFF, 0xFF, 0xFF, 0xFF, 0x78, 0x56, 0x34, 0x12,   // [62] int32[<=3] i32_le3
+    0x00, 0x00, 0x00, 0x00,                                 // [71] DelimitedFixedSize.0.1 nested_aligned
+    0xC3, 0x05,                                             // [75] bool[11] bits_11, void5
+    0x0A, 0x5A, 0x02,                                       // [77] bool[<=13] bits_le13, padding
+    0x00, 0x00, 0x00, 0x00,                                 // [80] DelimitedFixedSize.0.1 nested_padded
+    0x03, 0x06,                                             // [84] bool[<=3] bits_le3, padding
+};
+
+static void initByteAlignedReference(regulated_basics_ByteAligned_0_1* const obj)
+{
+    (void) memset(obj, 0, sizeof(*obj));
+    obj->u24 = 0x123456UL;
+    obj->u12 = 0xABCU;
+    obj->u40 = 0x0102030405ULL;
+    obj->u3  = 5U;
+    obj->u57 = 0x01FEDCBA98765432ULL;
+    obj->i16 = -2;
+    obj->u32 = 0x89ABCDEFUL;
+    obj->f16 = +1.5F;
+    obj->f32 = -2.5F;
+    obj->f64 = +0.25;
+    for (uint8_t k = 0U; k < 5U; k++)
+    {
+        obj->bytes_5[k] = (uint8_t) (k + 1U);
+    }
+    obj->u16_3[0] = 0x1122U;
+    obj->u16_3[1] = 0x3344U;
+    obj->u16_3[2] = 0x5566U;
+    obj->f32_2[0] = +1.0F;
+    obj->f32_2[1] = -2.0F;
+    obj->bytes_le6.elements[0] = 0xAAU;
+    obj->bytes_le6.elements[1] = 0xBBU;
+    obj->bytes_le6.elements[2] = 0xCCU;
+    obj->bytes_le6.count = 3U;
+    obj->i32_le3.elements[0] = -1;
+    obj->i32_le3.elements[1] = 0x12345678L;
+    obj->i32_le3.count = 2U;
+    obj->bits_11_bitpacked_[0] = 0xC3U;
+    obj->bits_11_bitpacked_[1] = 0xFDU;     // Only the three least significant bits belong to the array.
+    obj->bits_le13.bitpacked[0] = 0x5AU;
+    obj->bits_le13.bitpacked[1] = 0xFEU;    // Only the two least significant bits belong to the array.
+    obj->bits_le13.count = 10U;
+    obj->bits_le3.bitpacked[0] = 0xFEU;     // Only the three least significant bits belong to the array.
+    obj->bits_le3.count = 3U;
+}
+
+/// Serializes the reference object into a buffer filled with ones, so that any bit left unwritten stands out.
+static void serializeByteAlignedReference(uint8_t* const buf)
+{
+    regulated_basics_ByteAligned_0_1 obj;
+    initByteAlignedReference(&obj);
+    (void) memset(buf, 0xFF, regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_);
+    size_t size = regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_;
+    TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&obj, buf, &size));
+    TEST_ASSERT_EQUAL(sizeof(ByteAlignedReference), size);
+}
+
+static void testByteAlignedSerializeIntegers(void)
+{
+    uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    serializeByteAlignedReference(&buf[0]);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[0], &buf[0], 25U);      // u24 to u32
+}
+
+static void testByteAlignedSerializeArrays(void)
+{
+    uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    serializeByteAlignedReference(&buf[0]);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[39], &buf[39], 32U);    // bytes_5 to i32_le3
+}
+
+static void testByteAlignedSerializeFloats(void)
+{
+    uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    serializeByteAlignedReference(&buf[0]);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[25], &buf[25], 14U);    // f16 to f64
+}
+
+static void randByteAligned(regulated_basics_ByteAligned_0_1* const obj)
+{
+    (void) memset(obj, 0, sizeof(*obj));
+    obj->u24 = (uint32_t) randI32() & 0xFFFFFFUL;
+    obj->u12 = (uint16_t) randI16() & 0xFFFU;
+    obj->u40 = (uint64_t) randI64() & 0xFFFFFFFFFFULL;
+    obj->u3  = (uint8_t) randI8() & 7U;
+    obj->u57 = (uint64_t) randI64() & 0x1FFFFFFFFFFFFFFULL;
+    obj->i16 = randI16();
+    obj->u32 = (uint32_t) randI32();
+    obj->f16 = randF16();
+    obj->f32 = randF32();
+    obj->f64 = randF64();
+    for (size_t k = 0; k < 5U; k++)
+    {
+        obj->bytes_5[k] = (uint8_t) randI8();
+    }
+    for (size_t k = 0; k < 3U; k++)
+    {
+        obj->u16_3[k] = (uint16_t) randI16();
+        obj->i32_le3.elements[k] = randI32();
+    }
+    obj->f32_2[0] = randF32();
+    obj->f32_2[1] = randF32();
+    for (size_t k = 0; k < 6U; k++)
+    {
+        obj->bytes_le6.elements[k] = (uint8_t) randI8();
+    }
+    obj->bytes_le6.count = ((uint8_t) randI8()) % 7U;
+    obj->i32_le3.count = ((uint8_t) randI8()) % 4U;
+    obj->bits_11_bitpacked_[0] = (uint8_t) randI8();
+    obj->bits_11_bitpacked_[1] = (uint8_t) randI8();
+    obj->bits_le13.bitpacked[0] = (uint8_t) randI8();
+    obj->bits_le13.bitpacked[1] = (uint8_t) randI8();
+    obj->bits_le13.count = ((uint8_t) randI8()) % 14U;
+    obj->bits_le3.bitpacked[0] = (uint8_t) randI8();
+    obj->bits_le3.count = ((uint8_t) randI8()) % 4U;
+}
+
+static void testByteAlignedSerializeBitArrays(void)
+{
+    uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    serializeByteAlignedReference(&buf[0]);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[75], &buf[75], 5U);     // bits_11 to bits_le13
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[84], &buf[84], 2U);     // bits_le3
+
+    // The last byte of a bit array is merged with what follows, so the output must not depend on the prior contents
+    // of the buffer.
+    for (uint32_t i = 0U; i < 10; i++)
+    {
+        regulated_basics_ByteAligned_0_1 obj;
+        randByteAligned(&obj);
+        uint8_t buf_ones[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+        (void) memset(&buf[0], 0x00, sizeof(buf));
+        (void) memset(&buf_ones[0], 0xFF, sizeof(buf_ones));
+        size_t size = sizeof(buf);
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&obj, &buf[0], &size));
+        size_t size_ones = sizeof(buf_ones);
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&obj, &buf_ones[0], &size_ones));
+        TEST_ASSERT_EQUAL(size, size_ones);
+        TEST_ASSERT_EQUAL_HEX8_ARRAY(buf, buf_ones, size);
+    }
+}
+
+static void testByteAlignedSerializePadding(void)
+{
+    uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    serializeByteAlignedReference(&buf[0]);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[71], &buf[71], 4U);     // nested_aligned, no padding
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[79], &buf[79], 5U);     // padding, nested_padded
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(ByteAlignedReference, buf, sizeof(ByteAlignedReference));
+}
+
+/// Deserializes the given representation of ByteAligned.0.1 into an object filled with a non-zero pattern.
+static void deserializeByteAligned(const uint8_t* const sr, regulated_basics_ByteAligned_0_1* const obj)
+{
+    (void) memset(obj, 0x55, sizeof(*obj));
+    size_t size = sizeof(ByteAlignedReference);
+    TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_deserialize_(obj, sr, &size));
+    TEST_ASSERT_EQUAL(sizeof(ByteAlignedReference), size);
+}
+
+static void testByteAlignedDeserializeIntegers(void)
+{
+    regulated_basics_ByteAligned_0_1 obj;
+    deserializeByteAligned(&ByteAlignedReference[0], &obj);
+    TEST_ASSERT_EQUAL_HEX32(0x123456UL, obj.u24);
+    TEST_ASSERT_EQUAL_HEX16(0xABCU, obj.u12);
+    TEST_ASSERT_EQUAL_HEX64(0x0102030405ULL, obj.u40);
+    TEST_ASSERT_EQUAL(5U, obj.u3);
+    TEST_ASSERT_EQUAL_HEX64(0x01FEDCBA98765432ULL, obj.u57);
+    TEST_ASSERT_EQUAL_INT16(-2, obj.i16);
+    TEST_ASSERT_EQUAL_HEX32(0x89ABCDEFUL, obj.u32);
+
+    // The void fields are ignored by the deserializer, so the bits set there shall be masked off.
+    uint8_t sr[sizeof(ByteAlignedReference)];
+    (void) memcpy(&sr[0], &ByteAlignedReference[0], sizeof(sr));
+    sr[4]  |= 0xF0U;    // void4 after u12
+    sr[10] |= 0xF8U;    // void5 after u3
+    sr[18] |= 0xFEU;    // void7 after u57
+    deserializeByteAligned(&sr[0], &obj);
+    TEST_ASSERT_EQUAL_HEX16(0xABCU, obj.u12);
+    TEST_ASSERT_EQUAL(5U, obj.u3);
+    TEST_ASSERT_EQUAL_HEX64(0x01FEDCBA98765432ULL, obj.u57);
+}
+
+static void testByteAlignedRoundTrip(void)
+{
+    for (uint32_t i = 0U; i < 10; i++)
+    {
+        regulated_basics_ByteAligned_0_1 ref;
+        randByteAligned(&ref);
+        uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+        size_t size = sizeof(buf);
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&ref, &buf[0], &size));
+
+        // Serializing the deserialized object again shall reproduce the original representation exactly.
+        regulated_basics_ByteAligned_0_1 obj;
+        (void) memset(&obj, 0x55, sizeof(obj));
+        const size_t full_size = size;
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_deserialize_(&obj, &buf[0], &size));
+        TEST_ASSERT_EQUAL(full_size, size);
+        uint8_t buf_again[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+        size = sizeof(buf_again);
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&obj, &buf_again[0], &size));
+        TEST_ASSERT_EQUAL(full_size, size);
+        TEST_ASSERT_EQUAL_HEX8_ARRAY(buf, buf_again, full_size);
+    }
+}
+
+/*
+ * A truncated buffer takes the zero-extending fallback paths while a full buffer takes the direct byte access paths;
+ * per the implicit zero extension rule both shall produce the same object.
+ */
+static void testByteAlignedTruncated(void)
+{
+    for (uint32_t i = 0U; i < 10; i++)
+    {
+        regulated_basics_ByteAligned_0_1 ref;
+        randByteAligned(&ref);
+        uint8_t buf[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+        size_t size = sizeof(buf);
+        TEST_ASSERT_EQUAL(0, regulated_basics_ByteAligned_0_1_serialize_(&ref, &buf[0], &size));
+        const size_t full_size = size;
+
+        for (size_t trunc = 0U; trunc <= full_size; trunc++)
+        {
+            // Only the truncated prefix is allocated so that reads past its end are caught by the sanitizers.
+            uint8_t* const truncated = (uint8_t*) malloc(trunc + 1U);
+            TEST_ASSERT_TRUE(truncated != NULL);
+            (void) memcpy(truncated, &buf[0], trunc);
+            uint8_t extended[regulated_basics_ByteAligned_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+            (void) memset(&extended[0], 0, sizeof(extended));
+            (void) memcpy(&extended[0], &buf[0], trunc);
+
+            regulated_basics_ByteAligned_0_1 obj_truncated;
+            regulated_basics_ByteAligned_0_1 obj_extended;
+            (void) memset(&obj_truncated, 0, sizeof(obj_truncated));
+            (void) memset(&obj_extended, 0, sizeof(obj_extended));
+            size = trunc;
+            const int8_t err_truncated = regulated_basics_ByteAligned_0_1_deserialize_(&obj_truncated, truncated, &size);
+            size = sizeof(extended);
+            const int8_t err_extended = regulated_basics_ByteAligned_0_1_deserialize_(&obj_extended, &extended[0], &size);
+            free(truncated);
+            TEST_ASSERT_EQUAL(err_extended, err_truncated);
+            TEST_ASSERT_EQUAL(0, memcmp(&obj_extended, &obj_truncated, sizeof(obj_extended)));
+        }
+    }
+}
+
+static void testByteAlignedDeserializeFloats(void)
+{
+    regulated_basics_ByteAligned_0_1 obj;
+    deserializeByteAligned(&ByteAlignedReference[0], &obj);
+    TEST_ASSERT_EQUAL_FLOAT(+1.5F, obj.f16);
+    TEST_ASSERT_EQUAL_FLOAT(-2.5F, obj.f32);
+    TEST_ASSERT_EQUAL_DOUBLE(+0.25, obj.f64);
+}
+
+static void testByteAlignedDeserializeArrays(void)
+{
+    regulated_basics_ByteAligned_0_1 obj;
+    deserializeByteAligned(&ByteAlignedReference[0], &obj);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[39], obj.bytes_5, 5U);
+    TEST_ASSERT_EQUAL_HEX16(0x1122U, obj.u16_3[0]);
+    TEST_ASSERT_EQUAL_HEX16(0x3344U, obj.u16_3[1]);
+    TEST_ASSERT_EQUAL_HEX16(0x5566U, obj.u16_3[2]);
+    TEST_ASSERT_EQUAL_FLOAT(+1.0F, obj.f32_2[0]);
+    TEST_ASSERT_EQUAL_FLOAT(-2.0F, obj.f32_2[1]);
+    TEST_ASSERT_EQUAL(3U, obj.bytes_le6.count);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(&ByteAlignedReference[59], obj.bytes_le6.elements, 3U);
+    TEST_ASSERT_EQUAL(2U, obj.i32_le3.count);
+    TEST_ASSERT_EQUAL_INT32(-1, obj.i32_le3.elements[0]);
+    TEST_ASSERT_EQUAL_INT32(0x12345678L, obj.i32_le3.elements[1]);
+}
+
+static void testByteAlignedDeserializeBitArrays(void)
+{
+    // The bits set after the end of each bit array shall not leak into its last byte.
+    uint8_t sr[sizeof(ByteAlignedReference)];
+    (void) memcpy(&sr[0], &ByteAlignedReference[0], sizeof(sr));
+    sr[76] |= 0xF8U;    // void5 after bits_11
+    sr[79] |= 0xFCU;    // padding after bits_le13
+    sr[85] |= 0xF8U;    // padding after bits_le3
+    const uint8_t* const inputs[] = {&ByteAlignedReference[0], &sr[0]};
+    for (size_t i = 0U; i < 2U; i++)
+    {
+        regulated_basics_ByteAligned_0_1 obj;
+        deserializeByteAligned(inputs[i], &obj);
+        TEST_ASSERT_EQUAL_HEX8(0xC3U, obj.bits_11_bitpacked_[0]);
+        TEST_ASSERT_EQUAL_HEX8(0x05U, obj.bits_11_bitpacked_[1]);
+        TEST_ASSERT_EQUAL(10U, obj.bits_le13.count);
+        TEST_ASSERT_EQUAL_HEX8(0x5AU, obj.bits_le13.bitpacked[0]);
+        TEST_ASSERT_EQUAL_HEX8(0x02U, obj.bits_le13.bitpacked[1]);
+        TEST_ASSERT_EQUAL(3U, obj.bits_le3.count);
+        TEST_ASSERT_EQUAL_HEX8(0x06U, obj.bits_le3.bitpacked[0]);
+    }
+}
+
+/*
+ * The array length is stored in a size_t, which is wider than the two-byte length prefix here; none of its bytes may
+ * keep their previous contents after deserialization.
+ */
+static void testLongByteArray(void)
+{
+    const uint8_t sr[] = {0x02, 0x00, 'h', 'i'};
+    regulated_basics_LongByteArray_0_1 obj;
+    (void) memset(&obj, 0x55, sizeof(obj));             // Fill using a non-zero pattern.
+    size_t size = sizeof(sr);
+    TEST_ASSERT_EQUAL(0, regulated_basics_LongByteArray_0_1_deserialize_(&obj, &sr[0], &size));
+    TEST_ASSERT_EQUAL(sizeof(sr), size);
+    TEST_ASSERT_EQUAL(2U, obj.bytes_le256.count);
+    TEST_ASSERT_EQUAL('h', obj.bytes_le256.elements[0]);
+    TEST_ASSERT_EQUAL('i', obj.bytes_le256.elements[1]);
+
+    // The longest array, whose length does not fit in the first byte of the prefix.
+    regulated_basics_LongByteArray_0_1 ref;
+    for (size_t k = 0; k < 256U; k++)
+    {
+        ref.bytes_le256.elements[k] = (uint8_t) k;
+    }
+    ref.bytes_le256.count = 256U;
+    uint8_t buf[regulated_basics_LongByteArray_0_1_SERIALIZATION_BUFFER_SIZE_BYTES_];
+    size = sizeof(buf);
+    TEST_ASSERT_EQUAL(0, regulated_basics_LongByteArray_0_1_serialize_(&ref, &buf[0], &size));
+    TEST_ASSERT_EQUAL(258U, size);
+    TEST_ASSERT_EQUAL_HEX8(0x00U, buf[0]);
+    TEST_ASSERT_EQUAL_HEX8(0x01U, buf[1]);
+    (void) memset(&obj, 0x55, sizeof(obj));
+    TEST_ASSERT_EQUAL(0, regulated_basics_LongByteArray_0_1_deserialize_(&obj, &buf[0], &size));
+    TEST_ASSERT_EQUAL(258U, size);
+    TEST_ASSERT_EQUAL(256U, obj.bytes_le256.count);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(ref.bytes_le256.elements, obj.bytes_le256.elements, 256U);
+}
+
 /*
  * Test that deserialization methods do not signal an error if a zero size is specified for a null output buffer.
  */
@@ -909,6 +1261,18 @@ int main(void)
     RUN_TEST(testPrimitive);
     RUN_TEST(testPrimitiveArrayFixed);
     RUN_TEST(testPrimitiveArrayVariable);
+    RUN_TEST(testByteAlignedSerializeIntegers);
+    RUN_TEST(testByteAlignedSerializeArrays);
+    RUN_TEST(testByteAlignedSerializeFloats);
+    RUN_TEST(testByteAlignedSerializeBitArrays);
+    RUN_TEST(testByteAlignedSerializePadding);
+    RUN_TEST(testByteAlignedDeserializeIntegers);
+    RUN_TEST(testByteAlignedRoundTrip);
+    RUN_TEST(testByteAlignedTruncated);
+    RUN_TEST(testByteAlignedDeserializeFloats);
+    RUN_TEST(testByteAlignedDeserializeArrays);
+    RUN_TEST(testByteAlignedDeserializeBitArrays);
+    RUN_TEST(testLongByteArray);
     RUN_TEST(testIssue221);
     RUN_TEST(testIssue221_zeroExtensionRule);
 
@@ -63,6 +63,133 @@ static void testNunavutCopyBitsWithUnalignedOffset(void)
     TEST_ASSERT_EQUAL_HEX8(0x54, dst[0]);
 }
 
+/// Copies one bit at a time. Used as the reference for the optimized paths of nunavutCopyBits.
+static void helperCopyBitsNaive(uint8_t* const dst,
+                                const size_t dst_offset_bits,
+                                const size_t length_bits,
+                                const uint8_t* const src,
+                                const size_t src_offset_bits)
+{
+    for (size_t i = 0; i < length_bits; ++i)
+    {
+        const size_t src_bit = src_offset_bits + i;
+        const size_t dst_bit = dst_offset_bits + i;
+        const uint8_t bit_mask = (uint8_t)(1U << (dst_bit % 8U));
+        if (0U != ((src[src_bit / 8U] >> (src_bit % 8U)) & 1U))
+        {
+            dst[dst_bit / 8U] = (uint8_t)(dst[dst_bit / 8U] | bit_mask);
+        }
+        else
+        {
+            dst[dst_bit / 8U] = (uint8_t)(dst[dst_bit / 8U] & (uint8_t) ~bit_mask);
+        }
+    }
+}
+
+/// Copies the given range with nunavutCopyBits and with the reference and requires the destinations to match,
+/// including the bits around the copied range which must be left unchanged.
+static void helperAssertCopyBitsSameAsNaive(const size_t dst_offset_bits,
+                                            const size_t length_bits,
+                                            const size_t src_offset_bits)
+{
+    uint8_t src[40];
+    uint8_t expected[40];
+    uint8_t actual[40];
+    for (size_t i = 0; i < sizeof(src); ++i)
+    {
+        src[i] = (uint8_t)((i * 37U) + 0x5BU);
+    }
+    memset(expected, 0xA5, sizeof(expected));
+    memset(actual, 0xA5, sizeof(actual));
+    helperCopyBitsNaive(expected, dst_offset_bits, length_bits, src, src_offset_bits);
+    nunavutCopyBits(actual, dst_offset_bits, length_bits, src, src_offset_bits);
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(expected, actual, sizeof(expected));
+}
+
+static void testNunavutCopyBitsAlignedSourceUnalignedDestination(void)
+{
+    const uint8_t src[] = { 0xFF, 0x1F };
+    uint8_t dst[4];
+    memset(dst, 0, sizeof(dst));
+    // 13 bits at a 5-bit destination offset: the tail (5 carried bits + 5 last bits) spills into a second byte.
+    nunavutCopyBits(dst, 5, 13, src, 0);
+    TEST_ASSERT_EQUAL_HEX8(0xE0, dst[0]);
+    TEST_ASSERT_EQUAL_HEX8(0xFF, dst[1]);
+    TEST_ASSERT_EQUAL_HEX8(0x03, dst[2]);
+    TEST_ASSERT_EQUAL_HEX8(0x00, dst[3]);
+
+    for (size_t dst_offset_bits = 1; dst_offset_bits < 24; ++dst_offset_bits)
+    {
+        for (size_t length_bits = 1; length_bits <= 40; ++length_bits)
+        {
+            if ((dst_offset_bits % 8U) != 0U)
+            {
+                helperAssertCopyBitsSameAsNaive(dst_offset_bits, length_bits, 16);
+            }
+        }
+    }
+}
+
+static void testNunavutCopyBitsUnalignedSourceAlignedDestination(void)
+{
+    const uint8_t src[] = { 0xE0, 0xFF, 0x03 };
+    uint8_t dst[3];
+    memset(dst, 0, sizeof(dst));
+    // 13 bits at a 5-bit source offset: the remaining 5 bits span two source bytes.
+    nunavutCopyBits(dst, 0, 13, src, 5);
+    TEST_ASSERT_EQUAL_HEX8(0xFF, dst[0]);
+    TEST_ASSERT_EQUAL_HEX8(0x1F, dst[1]);
+    TEST_ASSERT_EQUAL_HEX8(0x00, dst[2]);
+
+    for (size_t src_offset_bits = 1; src_offset_bits < 24; ++src_offset_bits)
+    {
+        for (size_t length_bits = 1; length_bits <= 40; ++length_bits)
+        {
+            if ((src_offset_bits % 8U) != 0U)
+            {
+                helperAssertCopyBitsSameAsNaive(16, length_bits, src_offset_bits);
+            }
+        }
+    }
+}
+
+static void testNunavutCopyBitsBothUnaligned(void)
+{
+    const uint8_t src[] = { 0xF8, 0xFF, 0x00 };
+    uint8_t dst[3];
+    memset(dst, 0, sizeof(dst));
+    nunavutCopyBits(dst, 2, 13, src, 3);
+    TEST_ASSERT_EQUAL_HEX8(0xFC, dst[0]);
+    TEST_ASSERT_EQUAL_HEX8(0x7F, dst[1]);
+    TEST_ASSERT_EQUAL_HEX8(0x00, dst[2]);
+
+    for (size_t src_offset_bits = 1; src_offset_bits < 16; ++src_offset_bits)
+    {
+        for (size_t dst_offset_bits = 1; dst_offset_bits < 16; ++dst_offset_bits)
+        {
+            if (((src_offset_bits % 8U) != 0U) && ((dst_offset_bits % 8U) != 0U))
+            {
+                helperAssertCopyBitsSameAsNaive(dst_offset_bits, 21, src_offset_bits);
+            }
+        }
+    }
+}
+
+static void testNunavutCopyBitsLongHalfAligned(void)
+{
+    // Copies of nine bytes and more with a sub-byte remainder go through the word-at-a-time loops
+    // on little-endian targets, followed by the byte loop and the tail handling.
+    const size_t lengths_bits[] = { (9U * 8U) + 3U, (16U * 8U) + 5U, (17U * 8U) + 7U };
+    for (size_t i = 0; i < (sizeof(lengths_bits) / sizeof(lengths_bits[0])); ++i)
+    {
+        for (size_t mod = 1; mod < 8; ++mod)
+        {
+            helperAssertCopyBitsSameAsNaive(8U + mod, lengths_bits[i], 16U);
+            helperAssertCopyBitsSameAsNaive(16U, lengths_bits[i], 8U + mod);
+        }
+    }
+}
+
 // +--------------------------------------------------------------------------+
 // | nunavutSaturateBufferFragmentBitLength
 // +--------------------------------------------------------------------------+
@@ -188,6 +315,36 @@ static void testNunavutSetIxx_bufferOverflow(void)
     TEST_ASSERT_EQUAL_HEX8(0xAA, buffer[2]);
 }
 
+static void testNunavutSetUxx_singleWord(void)
+{
+    // The 20 bits at offset 13 fit into the 64-bit word loaded from data[1], which is within the buffer.
+    uint8_t data[] = {0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF};
+    TEST_ASSERT_EQUAL_INT8(NUNAVUT_SUCCESS, nunavutSetUxx(data, sizeof(data), 13, 0x00000, 20));
+    const uint8_t cleared[] = {0xFF, 0x1F, 0x00, 0x00, 0xFE, 0xFF, 0xFF, 0xFF, 0xFF};
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(cleared, data, sizeof(data));
+
+    memset(data, 0, sizeof(data));
+    TEST_ASSERT_EQUAL_INT8(NUNAVUT_SUCCESS, nunavutSetUxx(data, sizeof(data), 13, 0xABCDE, 20));
+    const uint8_t set[] = {0x00, 0xC0, 0x9B, 0x57, 0x01, 0x00, 0x00, 0x00, 0x00};
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(set, data, sizeof(data));
+}
+
+static void testNunavutSetUxx_singleWordPastBufferEnd(void)
+{
+    // Same value and offset as above but the buffer is one byte too short to load the word from data[1],
+    // so the value has to be written byte by byte. The buffers are sized exactly so that an out-of-bounds
+    // word access is caught by memory checkers.
+    uint8_t data[] = {0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF};
+    TEST_ASSERT_EQUAL_INT8(NUNAVUT_SUCCESS, nunavutSetUxx(data, sizeof(data), 13, 0x00000, 20));
+    const uint8_t cleared[] = {0xFF, 0x1F, 0x00, 0x00, 0xFE, 0xFF, 0xFF, 0xFF};
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(cleared, data, sizeof(data));
+
+    memset(data, 0, sizeof(data));
+    TEST_ASSERT_EQUAL_INT8(NUNAVUT_SUCCESS, nunavutSetUxx(data, sizeof(data), 13, 0xABCDE, 20));
+    const uint8_t set[] = {0x00, 0xC0, 0x9B, 0x57, 0x01, 0x00, 0x00, 0x00};
+    TEST_ASSERT_EQUAL_HEX8_ARRAY(set, data, sizeof(data));
+}
+
 // +--------------------------------------------------------------------------+
 // | nunavut[Get|Set]Bit
 // +--------------------------------------------------------------------------+
@@ -251,6 +408,22 @@ static void testNunavutGetU16_tooSmall(void)
     TEST_ASSERT_EQUAL_HEX16(0x0055, nunavutGetU16(data, sizeof(data), 9, 16U));
 }
 
+static void testNunavutGetU16_word(void)
+{
+    // The 64-bit word loaded from data[1] is within the buffer.
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88, 0x99, 0xAA};
+    TEST_ASSERT_EQUAL_HEX16(0x2199, nunavutGetU16(data, sizeof(data), 13, 16U));
+}
+
+static void testNunavutGetU16_wordPastBufferEnd(void)
+{
+    // Fewer than 8 bytes are left from the first byte read; the buffer is sized exactly so that an
+    // out-of-bounds word load is caught by memory checkers, and the bits past the end are zero-extended.
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88};
+    TEST_ASSERT_EQUAL_HEX16(0x2199, nunavutGetU16(data, sizeof(data), 13, 16U));
+    TEST_ASSERT_EQUAL_HEX16(0x221D, nunavutGetU16(data, sizeof(data), 50, 16U));
+}
+
 // +--------------------------------------------------------------------------+
 // | nunavutGetU32
 // +--------------------------------------------------------------------------+
@@ -267,6 +440,21 @@ static void testNunavutGetU32_tooSmall(void)
     TEST_ASSERT_EQUAL_HEX32(0x00555555, nunavutGetU32(data, sizeof(data), 9, 32U));
 }
 
+static void testNunavutGetU32_word(void)
+{
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88, 0x99, 0xAA};
+    TEST_ASSERT_EQUAL_HEX32(0x32AA2199, nunavutGetU32(data, sizeof(data), 13, 32U));
+    // The word loaded from data[1] ends exactly at the end of the buffer.
+    TEST_ASSERT_EQUAL_HEX32(0x32AA2199, nunavutGetU32(data, sizeof(data) - 1U, 13, 32U));
+}
+
+static void testNunavutGetU32_wordPastBufferEnd(void)
+{
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88};
+    TEST_ASSERT_EQUAL_HEX32(0x32AA2199, nunavutGetU32(data, sizeof(data), 13, 32U));
+    TEST_ASSERT_EQUAL_HEX32(0x00088776, nunavutGetU32(data, sizeof(data), 44, 32U));
+}
+
 // +--------------------------------------------------------------------------+
 // | nunavutGetU64
 // +--------------------------------------------------------------------------+
@@ -283,6 +471,19 @@ static void testNunavutGetU64_tooSmall(void)
     TEST_ASSERT_EQUAL_HEX64(0x0055555555555555, nunavutGetU64(data, sizeof(data), 9, 64U));
 }
 
+static void testNunavutGetU64_word(void)
+{
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88, 0x99, 0xAA};
+    TEST_ASSERT_EQUAL_HEX64(0x0008877665544332, nunavutGetU64(data, sizeof(data), 12, 52U));
+}
+
+static void testNunavutGetU64_wordPastBufferEnd(void)
+{
+    const uint8_t data[] = {0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88};
+    TEST_ASSERT_EQUAL_HEX64(0x0008877665544332, nunavutGetU64(data, sizeof(data), 12, 52U));
+    TEST_ASSERT_EQUAL_HEX64(0x0000000000088776, nunavutGetU64(data, sizeof(data), 44, 52U));
+}
+
 // +--------------------------------------------------------------------------+
 // | nunavutGetI8
 // +--------------------------------------------------------------------------+
@@ -764,12 +965,18 @@ int main(void)
     RUN_TEST(testNunavutCopyBits);
     RUN_TEST(testNunavutCopyBitsWithAlignedOffset);
     RUN_TEST(testNunavutCopyBitsWithUnalignedOffset);
+    RUN_TEST(testNunavutCopyBitsAlignedSourceUnalignedDestination);
+    RUN_TEST(testNunavutCopyBitsUnalignedSourceAlignedDestination);
+    RUN_TEST(testNunavutCopyBitsBothUnaligned);
+    RUN_TEST(testNunavutCopyBitsLongHalfAligned);
     RUN_TEST(testNunavutSaturateBufferFragmentBitLength);
     RUN_TEST(testNunavutGetBits);
     RUN_TEST(testNunavutSetIxx_neg1);
     RUN_TEST(testNunavutSetIxx_neg255);
     RUN_TEST(testNunavutSetIxx_neg255_tooSmall);
     RUN_TEST(testNunavutSetIxx_bufferOverflow);
+    RUN_TEST(testNunavutSetUxx_singleWord);
+    RUN_TEST(testNunavutSetUxx_singleWordPastBufferEnd);
     RUN_TEST(testNunavutSetBit);
     RUN_TEST(testNunavutSetBit_bufferOverflow);
     RUN_TEST(testNunavutGetBit);
@@ -777,10 +984,16 @@ int main(void)
     RUN_TEST(testNunavutGetU8_tooSmall);
     RUN_TEST(testNunavutGetU16);
     RUN_TEST(testNunavutGetU16_tooSmall);
+    RUN_TEST(testNunavutGetU16_word);
+    RUN_TEST(testNunavutGetU16_wordPastBufferEnd);
     RUN_TEST(testNunavutGetU32);
     RUN_TEST(testNunavutGetU32_tooSmall);
+    RUN_TEST(testNunavutGetU32_word);
+    RUN_TEST(testNunavutGetU32_wordPastBufferEnd);
     RUN_TEST(testNunavutGetU64);
     RUN_TEST(testNunavutGetU64_tooSmall);
+    RUN_TEST(testNunavutGetU64_word);
+    RUN_TEST(testNunavutGetU64_wordPastBufferEnd);
     RUN_TEST(testNunavutGetI8);
     RUN_TEST(testNunavutGetI8_tooSmall);
     RUN_TEST(testNunavutGetI8_tooSmallAndNegative);